@@ -0,0 +1,167 @@
+"""
+Content-addressed backup archive
+Backup contents are stored once under archive/objects/<sha256>.json; the
+timestamped archive/resume-data_YYYYMMDD_HHMMSS.json entries are hard links
+to those objects, so identical backups take no extra space and each entry
+is still a plain JSON file that can be copied back to restore it. Objects
+are read-only; the app replaces resume-data.json instead of rewriting it,
+so a restored (even moved or linked) backup is never modified in place.
+
+Dedupe an archive folder written by older versions:
+
+    python archive.py archive/
+    python archive.py archive/ --dry-run
+"""
+
+import os
+import re
+import sys
+import stat
+import shutil
+import hashlib
+
+OBJECTS_DIR = 'objects'
+BACKUP_PREFIX = 'resume-data_'
+# resume-data_<YYYYMMDD_HHMMSS>[_<n>].json, n counting same-second backups
+BACKUP_NAME = re.compile(r'resume-data_(\d{8}_\d{6})(?:_(\d+))?\.json$')
+
+
+def file_hash(path):
+    """Return the sha256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def object_path(archive_dir, digest):
+    return os.path.join(archive_dir, OBJECTS_DIR, f'{digest}.json')
+
+
+def backup_order(name):
+    """Sort key for backup names: (timestamp, same-second counter)"""
+    match = BACKUP_NAME.match(name)
+    return match.group(1), int(match.group(2) or 0)
+
+
+def list_backups(archive_dir, newest_first=True):
+    """Return timestamped backup file names, newest first by default"""
+    if not os.path.isdir(archive_dir):
+        return []
+    return sorted((name for name in os.listdir(archive_dir) if BACKUP_NAME.match(name)),
+                  key=backup_order, reverse=newest_first)
+
+
+def _tmp_name(path):
+    """A temp path next to path that no other writer will pick"""
+    return f'{path}.{os.getpid()}.{os.urandom(6).hex()}.tmp'
+
+
+def _link(target, link_path):
+    """Atomically point link_path at target, copying if hard links are unsupported"""
+    tmp_path = _tmp_name(link_path)
+    try:
+        os.link(target, tmp_path)
+    except OSError:
+        shutil.copy2(target, tmp_path)
+    os.replace(tmp_path, link_path)
+
+
+def _link_new(target, link_path):
+    """Create link_path pointing at target; FileExistsError if the name is taken"""
+    try:
+        os.link(target, link_path)
+    except FileExistsError:
+        raise
+    except OSError:
+        with open(target, 'rb') as src, open(link_path, 'xb') as dst:
+            shutil.copyfileobj(src, dst)
+        shutil.copystat(target, link_path)
+
+
+def _make_read_only(path):
+    mode = os.stat(path).st_mode
+    os.chmod(path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def store_object(archive_dir, src):
+    """Store a read-only copy of src in the object store (once per content).
+
+    Objects are always copied, never linked from src, and every backup
+    linking to an object shares its read-only mode, so writing through any
+    one name cannot change the others. Returns the digest.
+    """
+    digest = file_hash(src)
+    path = object_path(archive_dir, digest)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = _tmp_name(path)
+        shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, path)
+    _make_read_only(path)
+    return digest
+
+
+def store_backup(archive_dir, src, timestamp):
+    """Back up src as resume-data_<timestamp>.json, returning (digest, backup path).
+
+    A second backup within the same second becomes
+    resume-data_<timestamp>_1.json and so on; existing entries are never
+    overwritten.
+    """
+    digest = store_object(archive_dir, src)
+    target = object_path(archive_dir, digest)
+    suffix = 0
+    while True:
+        name = f'{BACKUP_PREFIX}{timestamp}_{suffix}.json' if suffix else f'{BACKUP_PREFIX}{timestamp}.json'
+        backup_path = os.path.join(archive_dir, name)
+        try:
+            _link_new(target, backup_path)
+            return digest, backup_path
+        except FileExistsError:
+            suffix += 1
+
+
+def dedupe_archive(archive_dir, dry_run=False):
+    """Move existing backups into the object store, replacing copies with links.
+
+    Returns (backups linked, bytes reclaimed).
+    """
+    linked = reclaimed = 0
+    seen = set()
+    for name in list_backups(archive_dir):
+        path = os.path.join(archive_dir, name)
+        digest = file_hash(path)
+        target = object_path(archive_dir, digest)
+
+        if os.path.exists(target) and os.path.samefile(path, target):
+            seen.add(digest)
+            continue
+        if digest in seen or os.path.exists(target):
+            reclaimed += os.path.getsize(path)
+        seen.add(digest)
+
+        if not dry_run:
+            store_object(archive_dir, path)
+            _link(target, path)
+        linked += 1
+    return linked, reclaimed
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Deduplicate a resume backup archive')
+    parser.add_argument('archive_dir', nargs='?', default='archive')
+    parser.add_argument('--dry-run', action='store_true', help='report without changing files')
+    args = parser.parse_args(argv)
+
+    linked, reclaimed = dedupe_archive(args.archive_dir, dry_run=args.dry_run)
+    action = 'Would link' if args.dry_run else 'Linked'
+    print(f"{action} {linked} backup(s) to the object store, reclaiming {reclaimed} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Startup benchmark
+Measures cold import time of app.py with `python -X importtime` and the
+time to build the application, and fails if either exceeds its budget.
+
+`import app` loads no Flask, so scripts that only need load_resume() /
+save_resume() stay cheap; create_app() pays for Flask, Jinja and views.py.
+
+    python bench_startup.py
+    python bench_startup.py --import-budget-ms 300 --runs 10
+"""
+
+import os
+import re
+import sys
+import argparse
+import statistics
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+# Cumulative budgets in milliseconds: roughly 2x the medians measured with
+# Flask 3.1 / Python 3.11 (import app: 15-22 ms, create_app(): 156 ms), to
+# leave room for slower hosts while still catching a new eager import
+IMPORT_BUDGET_MS = 45
+CREATE_APP_BUDGET_MS = 300
+
+CREATE_APP_SNIPPET = '''
+import time
+import app
+start = time.perf_counter()
+app.create_app()
+print((time.perf_counter() - start) * 1000)
+'''
+
+
+def parse_importtime(stderr):
+    """Return [(self_us, cumulative_us, depth, module)] from -X importtime output"""
+    rows = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((int(self_us), int(cumulative_us), len(indent) // 2, module))
+    return rows
+
+
+def measure_import():
+    """Import app.py in a fresh interpreter, return importtime rows"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=HERE, capture_output=True, text=True, check=True
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_create_app():
+    """Time create_app() in a fresh interpreter, in milliseconds"""
+    result = subprocess.run(
+        [sys.executable, '-c', CREATE_APP_SNIPPET],
+        cwd=HERE, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure Resume Editor startup time')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters per measurement')
+    parser.add_argument('--top', type=int, default=10, help='slowest top-level imports to show')
+    parser.add_argument('--import-budget-ms', type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument('--create-app-budget-ms', type=float, default=CREATE_APP_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    import_ms = []
+    rows = []
+    for _ in range(args.runs):
+        rows = measure_import()
+        total = next(cumulative for _, cumulative, depth, module in rows
+                     if module == 'app' and depth == 0)
+        import_ms.append(total / 1000)
+    create_ms = [measure_create_app() for _ in range(args.runs)]
+
+    import_median = statistics.median(import_ms)
+    create_median = statistics.median(create_ms)
+
+    print(f"import app   median {import_median:8.1f} ms  (budget {args.import_budget_ms:.0f} ms)")
+    print(f"create_app() median {create_median:8.1f} ms  (budget {args.create_app_budget_ms:.0f} ms)")
+    print("\nSlowest imports (last run, cumulative):")
+    top_level = sorted((r for r in rows if r[2] <= 1), key=lambda r: r[1], reverse=True)
+    for _, cumulative, _, module in top_level[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+    over = import_median > args.import_budget_ms or create_median > args.create_app_budget_ms
+    if over:
+        print("\n❌ Startup budget exceeded")
+        return 1
+    print("\n✅ Within startup budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
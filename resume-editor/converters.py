@@ -0,0 +1,413 @@
+"""
+Resume format converters
+Map JSON Resume, YAML and Markdown documents to and from the editor's
+native resume-data.json structure.
+
+Can also be run as a streaming CLI over JSONL batches:
+
+    python converters.py --from jsonresume --to native < in.jsonl > out.jsonl
+
+Each input line holds one document: a JSON object for the JSON based
+formats (native, jsonresume) or a JSON string for the text formats
+(yaml, markdown). Lines are converted and written one at a time, so memory
+use stays bounded regardless of batch size.
+"""
+
+import re
+import sys
+import json
+
+PRESENT = 'Present'
+ISO_DATE = re.compile(r'\d{4}(-\d{2}(-\d{2})?)?')
+# ' - ', ' to ', or a bare dash between a year and a year / 'Present'
+PERIOD_SEPARATOR = re.compile(r'\s+[-–—]\s+|\s+to\s+|(?<=\d{4})[-–—](?=\d{4}\b|present\b)', re.I)
+
+
+def get_empty_resume():
+    """Return empty resume structure"""
+    return {
+        "profile": {
+            "name": "",
+            "title": "",
+            "email": "",
+            "phone": "",
+            "linkedin": "",
+            "location": "",
+            "summary": ""
+        },
+        "skills": [],
+        "experience": [],
+        "achievements": []
+    }
+
+
+def _text(value):
+    """Coerce a scalar to a stripped string"""
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+def _lines(values):
+    """Coerce a list of scalars to non-empty strings"""
+    if isinstance(values, str):
+        values = [values]
+    return [_text(v) for v in values or [] if _text(v)]
+
+
+def normalize(data):
+    """Fill in missing fields so data matches get_empty_resume()"""
+    resume = get_empty_resume()
+    profile = data.get('profile') or {}
+    for key in resume['profile']:
+        resume['profile'][key] = _text(profile.get(key))
+
+    for skill in data.get('skills') or []:
+        items = skill.get('items')
+        if isinstance(items, list):
+            items = ', '.join(_lines(items))
+        resume['skills'].append({
+            'category': _text(skill.get('category')),
+            'items': _text(items)
+        })
+
+    for exp in data.get('experience') or []:
+        resume['experience'].append({
+            'title': _text(exp.get('title')),
+            'company': _text(exp.get('company')),
+            'period': _text(exp.get('period')),
+            'responsibilities': _lines(exp.get('responsibilities'))
+        })
+
+    for ach in data.get('achievements') or []:
+        resume['achievements'].append({
+            'title': _text(ach.get('title')),
+            'points': _lines(ach.get('points'))
+        })
+    return resume
+
+
+# ===== NATIVE =====
+def from_native(doc):
+    return normalize(doc)
+
+
+def to_native(data):
+    return normalize(data)
+
+
+# ===== JSON RESUME (https://jsonresume.org/schema) =====
+def _strip_scheme(url):
+    return re.sub(r'^https?://(www\.)?', '', _text(url)).rstrip('/')
+
+
+def _split_period(period):
+    """Split '2019 - Present' into ('2019', '') and '2010-2013' into ('2010', '2013')"""
+    parts = [p.strip() for p in PERIOD_SEPARATOR.split(period, maxsplit=1)]
+    start = parts[0] if parts else ''
+    end = parts[1] if len(parts) > 1 else ''
+    if end.lower() == PRESENT.lower():
+        end = ''
+    return start, end
+
+
+def from_json_resume(doc):
+    basics = doc.get('basics') or {}
+    location = basics.get('location') or {}
+    if isinstance(location, dict):
+        location = ', '.join(_lines([location.get('city'), location.get('region'),
+                                     location.get('countryCode')]))
+
+    linkedin = ''
+    for profile in basics.get('profiles') or []:
+        if _text(profile.get('network')).lower() == 'linkedin':
+            linkedin = _strip_scheme(profile.get('url')) or \
+                f"linkedin.com/in/{_text(profile.get('username'))}"
+            break
+
+    experience = []
+    for work in doc.get('work') or []:
+        start, end = _text(work.get('startDate')), _text(work.get('endDate'))
+        summary = _lines([work.get('summary')])
+        if start and end:
+            period = f"{start} - {end}"
+        elif start:
+            period = f"{start} - {PRESENT}"
+        else:
+            # Without dates, the summary holds a free-text period (see to_json_resume)
+            period = summary.pop(0) if summary else end
+        experience.append({
+            'title': work.get('position'),
+            'company': work.get('name') or work.get('company'),
+            'period': period,
+            'responsibilities': summary + _lines(work.get('highlights'))
+        })
+
+    return normalize({
+        'profile': {
+            'name': basics.get('name'),
+            'title': basics.get('label'),
+            'email': basics.get('email'),
+            'phone': basics.get('phone'),
+            'linkedin': linkedin,
+            'location': location,
+            'summary': basics.get('summary')
+        },
+        'skills': [{'category': s.get('name'), 'items': s.get('keywords') or []}
+                   for s in doc.get('skills') or []],
+        'experience': experience,
+        'achievements': [{'title': a.get('title'), 'points': _text(a.get('summary')).splitlines()}
+                         for a in doc.get('awards') or []]
+    })
+
+
+def to_json_resume(data):
+    data = normalize(data)
+    profile = data['profile']
+    basics = {
+        'name': profile['name'],
+        'label': profile['title'],
+        'email': profile['email'],
+        'phone': profile['phone'],
+        'summary': profile['summary'],
+        'location': {'city': profile['location']},
+        'profiles': []
+    }
+    if profile['linkedin']:
+        basics['profiles'].append({
+            'network': 'LinkedIn',
+            'url': 'https://' + _strip_scheme(profile['linkedin'])
+        })
+
+    work = []
+    for exp in data['experience']:
+        start, end = _split_period(exp['period'])
+        entry = {'name': exp['company'], 'position': exp['title'],
+                 'highlights': exp['responsibilities']}
+        # The schema requires ISO dates; keep any other period text (or a
+        # lone date, which would read back as ongoing) in summary
+        is_range = PERIOD_SEPARATOR.search(exp['period'])
+        if is_range and ISO_DATE.fullmatch(start) and (not end or ISO_DATE.fullmatch(end)):
+            entry['startDate'] = start
+            if end:
+                entry['endDate'] = end
+        elif exp['period']:
+            entry['summary'] = exp['period']
+        work.append(entry)
+
+    return {
+        'basics': basics,
+        'work': work,
+        'skills': [{'name': s['category'], 'keywords': _lines(s['items'].split(','))}
+                   for s in data['skills']],
+        'awards': [{'title': a['title'], 'summary': '\n'.join(a['points'])}
+                   for a in data['achievements']]
+    }
+
+
+# ===== YAML =====
+def _yaml():
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError('YAML support requires PyYAML: pip install pyyaml') from None
+    return yaml
+
+
+def from_yaml(text):
+    return normalize(_yaml().safe_load(text) or {})
+
+
+def to_yaml(data):
+    return _yaml().safe_dump(normalize(data), sort_keys=False, allow_unicode=True)
+
+
+# ===== MARKDOWN =====
+CONTACT_LABELS = (('email', 'Email'), ('phone', 'Phone'),
+                  ('linkedin', 'LinkedIn'), ('location', 'Location'))
+# '#', '## Skills', '### Dev — Acme'; the text is optional so empty fields survive
+HEADING = re.compile(r'(#{1,3})(?:\s+(.*))?')
+COMPANY_SEPARATOR = re.compile(r'(?:^|\s+)(?:—|--|@|\|)(?:\s+|$)')
+
+
+def _heading(level, text):
+    return f"{'#' * level} {text}".rstrip()
+
+
+def to_markdown(data):
+    data = normalize(data)
+    profile = data['profile']
+    out = [_heading(1, profile['name'])]
+    if profile['title']:
+        out += ['', f"**{profile['title']}**"]
+    contacts = [f"- {label}: {profile[key]}" for key, label in CONTACT_LABELS if profile[key]]
+    if contacts:
+        out += [''] + contacts
+    if profile['summary']:
+        out += ['', '## Summary', '', profile['summary']]
+
+    if data['skills']:
+        out += ['', '## Skills', '']
+        out += [f"- **{s['category']}:** {s['items']}" for s in data['skills']]
+
+    if data['experience']:
+        out += ['', '## Experience']
+        for exp in data['experience']:
+            heading = f"{exp['title']} — {exp['company']}" if exp['company'] else exp['title']
+            out += ['', _heading(3, heading.strip())]
+            if exp['period']:
+                out.append(f"_{exp['period']}_")
+            out += [''] + [f"- {r}" for r in exp['responsibilities']]
+
+    if data['achievements']:
+        out += ['', '## Achievements']
+        for ach in data['achievements']:
+            out += ['', _heading(3, ach['title']), '']
+            out += [f"- {p}" for p in ach['points']]
+
+    return '\n'.join(out) + '\n'
+
+
+def from_markdown(text):
+    data = get_empty_resume()
+    profile = data['profile']
+    labels = {label.lower(): key for key, label in CONTACT_LABELS}
+    section = None
+    item = None
+    summary = []
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+
+        heading = HEADING.fullmatch(line)
+        level = len(heading.group(1)) if heading else 0
+        text = (heading.group(2) or '').strip() if heading else ''
+
+        if level == 1:
+            profile['name'] = text
+            section = 'profile'
+        elif level == 2:
+            section = text.lower()
+            item = None
+        elif level == 3:
+            if section == 'experience':
+                parts = COMPANY_SEPARATOR.split(text, maxsplit=1)
+                item = {'title': parts[0], 'company': parts[1] if len(parts) > 1 else '',
+                        'period': '', 'responsibilities': []}
+                data['experience'].append(item)
+            elif section == 'achievements':
+                item = {'title': text, 'points': []}
+                data['achievements'].append(item)
+        elif line.startswith(('- ', '* ')):
+            bullet = line[2:].strip()
+            if section == 'profile':
+                label, _, value = bullet.partition(':')
+                if label.strip().lower() in labels:
+                    profile[labels[label.strip().lower()]] = value.strip()
+            elif section == 'skills':
+                match = re.match(r'\*\*(.*?):?\*\*:?\s*(.*)', bullet)
+                category, items = match.groups() if match else bullet.partition(':')[::2]
+                data['skills'].append({'category': category, 'items': items})
+            elif section == 'experience' and item:
+                item['responsibilities'].append(bullet)
+            elif section == 'achievements' and item:
+                item['points'].append(bullet)
+        elif section == 'profile' and re.fullmatch(r'\*\*(.+)\*\*', line):
+            profile['title'] = line[2:-2]
+        elif section == 'experience' and item and re.fullmatch(r'[_*](.+)[_*]', line):
+            item['period'] = line[1:-1]
+        elif section == 'summary':
+            summary.append(line)
+
+    profile['summary'] = ' '.join(summary)
+    return normalize(data)
+
+
+# ===== REGISTRY =====
+# name: (importer, exporter, mimetype, file extension)
+FORMATS = {
+    'native': (from_native, to_native, 'application/json', 'json'),
+    'jsonresume': (from_json_resume, to_json_resume, 'application/json', 'json'),
+    'yaml': (from_yaml, to_yaml, 'application/x-yaml', 'yaml'),
+    'markdown': (from_markdown, to_markdown, 'text/markdown', 'md'),
+}
+TEXT_FORMATS = ('yaml', 'markdown')
+
+
+def get_format(fmt):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}' (expected one of: {', '.join(FORMATS)})")
+    return FORMATS[fmt]
+
+
+def import_resume(fmt, doc):
+    """Convert a document (dict for JSON formats, str for text formats) to native data"""
+    return get_format(fmt)[0](doc)
+
+
+def export_resume(fmt, data):
+    """Convert native data to a document in the given format"""
+    return get_format(fmt)[1](data)
+
+
+def parse_document(fmt, text):
+    """Convert raw document text to native data"""
+    if fmt in TEXT_FORMATS:
+        return import_resume(fmt, text)
+    return import_resume(fmt, json.loads(text))
+
+
+def render_document(fmt, data):
+    """Convert native data to raw document text"""
+    doc = export_resume(fmt, data)
+    if fmt in TEXT_FORMATS:
+        return doc
+    return json.dumps(doc, indent=2, ensure_ascii=False)
+
+
+def convert_stream(lines, src, dst):
+    """Convert JSONL lines from src to dst format, yielding (line_no, output, error)"""
+    get_format(src)
+    get_format(dst)
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            data = import_resume(src, json.loads(line))
+            yield line_no, json.dumps(export_resume(dst, data), ensure_ascii=False), None
+        except Exception as e:
+            yield line_no, None, e
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Convert resume documents in JSONL batches')
+    parser.add_argument('--from', dest='src', required=True, choices=FORMATS)
+    parser.add_argument('--to', dest='dst', required=True, choices=FORMATS)
+    parser.add_argument('input', nargs='?', default='-', help='JSONL input file (default: stdin)')
+    parser.add_argument('output', nargs='?', default='-', help='JSONL output file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    infile = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    outfile = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    failed = 0
+    try:
+        for line_no, output, error in convert_stream(infile, args.src, args.dst):
+            if error is not None:
+                failed += 1
+                print(f"line {line_no}: {error}", file=sys.stderr)
+            else:
+                outfile.write(output + '\n')
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
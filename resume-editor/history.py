@@ -0,0 +1,264 @@
+"""
+SQLite resume history (optional)
+Every save records the full document plus one hash per section, so
+questions like "all versions from last month" or "when did the title
+change" are answered from indexes instead of opening every backup file.
+
+Sections are the top-level keys plus each profile field ('profile.title',
+'profile.email', ...).
+
+Import an existing archive folder (and the current resume-data.json) once:
+
+    python history.py archive/ --db history.sqlite3
+"""
+
+import os
+import sys
+import json
+import hashlib
+import sqlite3
+from datetime import datetime, timedelta
+from archive import BACKUP_NAME, list_backups
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY,
+    saved_at TEXT NOT NULL,
+    doc_hash TEXT NOT NULL,
+    document TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versions_saved_at ON versions (saved_at);
+CREATE TABLE IF NOT EXISTS sections (
+    version_id INTEGER NOT NULL REFERENCES versions (id),
+    section TEXT NOT NULL,
+    section_hash TEXT NOT NULL,
+    PRIMARY KEY (version_id, section)
+);
+CREATE INDEX IF NOT EXISTS sections_hash ON sections (section, section_hash);
+'''
+
+
+def _hash(value):
+    text = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def section_values(data):
+    """Return {section: value} for every tracked section of a resume"""
+    values = dict(data)
+    for field, value in (data.get('profile') or {}).items():
+        values[f'profile.{field}'] = value
+    return values
+
+
+# Databases whose schema has been created by this process
+_initialized = set()
+
+
+def connect(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    if db_path not in _initialized:
+        conn.executescript(SCHEMA)
+        _initialized.add(db_path)
+    return conn
+
+
+def _insert(conn, data, saved_at):
+    """Insert one version and its section hashes; return its id.
+
+    saved_at has one-second resolution, so several versions may share it;
+    their id keeps them in save order.
+    """
+    cursor = conn.execute(
+        'INSERT INTO versions (saved_at, doc_hash, document) VALUES (?, ?, ?)',
+        (saved_at, _hash(data), json.dumps(data, ensure_ascii=False))
+    )
+    version_id = cursor.lastrowid
+    conn.executemany(
+        'INSERT INTO sections (version_id, section, section_hash) VALUES (?, ?, ?)',
+        [(version_id, section, _hash(value)) for section, value in section_values(data).items()]
+    )
+    return version_id
+
+
+def record_version(db_path, data, saved_at=None):
+    """Record a saved document and its section hashes in one transaction"""
+    saved_at = saved_at or datetime.now().isoformat(timespec='seconds')
+    conn = connect(db_path)
+    try:
+        with conn:
+            return _insert(conn, data, saved_at)
+    finally:
+        conn.close()
+
+
+def parse_bound(value):
+    """Normalize an ISO date or datetime to a local saved_at string.
+
+    saved_at is stored as naive local time to the second, so a timezone
+    offset is converted to local time first. Raises ValueError if value is
+    not ISO 8601.
+    """
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return moment.isoformat(timespec='seconds')
+
+
+def list_versions(db_path, since=None, until=None):
+    """Versions saved in [since, until) (ISO dates or datetimes), newest first.
+
+    Raises ValueError if since or until is not an ISO date or datetime.
+    """
+    conditions, params = [], []
+    if since:
+        conditions.append('saved_at >= ?')
+        params.append(parse_bound(since))
+    if until:
+        conditions.append('saved_at < ?')
+        params.append(parse_bound(until))
+    conn = connect(db_path)
+    try:
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        rows = conn.execute(
+            f'SELECT id, saved_at, doc_hash FROM versions {where} ORDER BY saved_at DESC, id DESC',
+            params
+        ).fetchall()
+        return [dict(row) for row in rows]
+    finally:
+        conn.close()
+
+
+def section_changes(db_path, section):
+    """Versions where section differs from the previous version, newest first"""
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(
+            '''SELECT id, saved_at, section_hash, document FROM (
+                   SELECT v.id, v.saved_at, s.section_hash, v.document,
+                          LAG(s.section_hash) OVER (ORDER BY v.saved_at, v.id) AS previous_hash
+                   FROM sections s JOIN versions v ON v.id = s.version_id
+                   WHERE s.section = ?
+               )
+               WHERE previous_hash IS NULL OR previous_hash != section_hash
+               ORDER BY saved_at DESC, id DESC''',
+            (section,)
+        ).fetchall()
+        return [{
+            'id': row['id'],
+            'saved_at': row['saved_at'],
+            'section_hash': row['section_hash'],
+            'value': section_values(json.loads(row['document'])).get(section)
+        } for row in rows]
+    finally:
+        conn.close()
+
+
+def find_section(db_path, section, section_hash):
+    """Versions whose section content has the given hash, newest first"""
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(
+            '''SELECT v.id, v.saved_at, v.doc_hash FROM sections s
+               JOIN versions v ON v.id = s.version_id
+               WHERE s.section = ? AND s.section_hash = ?
+               ORDER BY v.saved_at DESC, v.id DESC''',
+            (section, section_hash)
+        ).fetchall()
+        return [dict(row) for row in rows]
+    finally:
+        conn.close()
+
+
+def _already_recorded(conn, saved_at, doc_hash):
+    """True if doc_hash is the newest version at or before saved_at, or was
+    saved within that same second (whose order the archive cannot tell)"""
+    row = conn.execute(
+        'SELECT doc_hash FROM versions WHERE saved_at <= ? ORDER BY saved_at DESC, id DESC LIMIT 1',
+        (saved_at,)
+    ).fetchone()
+    if row and row['doc_hash'] == doc_hash:
+        return True
+    return conn.execute(
+        'SELECT 1 FROM versions WHERE saved_at = ? AND doc_hash = ? LIMIT 1',
+        (saved_at, doc_hash)
+    ).fetchone() is not None
+
+
+def _file_time(path):
+    return datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec='seconds')
+
+
+def archive_versions(archive_dir, resume_file=None):
+    """Yield (saved_at, path) for every document in the archive and resume_file.
+
+    A backup named <ts> holds the document as it was *before* the save at
+    <ts>, so it was saved at the previous backup's <ts>. The oldest one is
+    dated by its file mtime when that is earlier than <ts>; otherwise (the
+    mtime was reset by a copy or by the object store) one second before
+    <ts>, so it still sorts before the save that replaced it. The live
+    resume_file was written by the newest save and is dated by its mtime.
+    """
+    previous = None
+    for name in list_backups(archive_dir, newest_first=False):
+        match = BACKUP_NAME.match(name)
+        path = os.path.join(archive_dir, name)
+        replaced_at = datetime.strptime(match.group(1), '%Y%m%d_%H%M%S')
+        if previous is None:
+            mtime = datetime.fromtimestamp(int(os.path.getmtime(path)))
+            previous = mtime if mtime < replaced_at else replaced_at - timedelta(seconds=1)
+        yield previous.isoformat(), path
+        previous = replaced_at
+    if resume_file and os.path.exists(resume_file):
+        yield max(_file_time(resume_file), previous.isoformat() if previous else ''), resume_file
+
+
+def import_archive(db_path, archive_dir, resume_file=None):
+    """Record every backup in archive_dir plus resume_file; return (imported, skipped).
+
+    Runs in one transaction and is safe to re-run. A document is skipped
+    when it matches the newest version already recorded at or before its
+    save time, or one recorded in that same second, so versions recorded
+    live by save_resume() are not duplicated, while a later revert to
+    older content is still kept.
+    """
+    imported = skipped = 0
+    conn = connect(db_path)
+    try:
+        with conn:
+            for saved_at, path in archive_versions(archive_dir, resume_file):
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except ValueError as e:
+                    print(f"{path}: {e}", file=sys.stderr)
+                    skipped += 1
+                    continue
+                if _already_recorded(conn, saved_at, _hash(data)):
+                    skipped += 1
+                else:
+                    _insert(conn, data, saved_at)
+                    imported += 1
+    finally:
+        conn.close()
+    return imported, skipped
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Import resume backups into the SQLite history')
+    parser.add_argument('archive_dir', nargs='?', default='archive')
+    parser.add_argument('--db', default='history.sqlite3', help='history database path')
+    parser.add_argument('--resume-file', default='resume-data.json',
+                        help='current resume, imported as the newest version')
+    args = parser.parse_args(argv)
+
+    imported, skipped = import_archive(args.db, args.archive_dir, args.resume_file)
+    print(f"Imported {imported} version(s) into {args.db}, skipped {skipped}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+In-process token bucket rate limiter
+Each key (e.g. client address + resume file) gets a bucket holding up to
+`burst` tokens that refills at `rate` tokens per second.
+"""
+
+import time
+import threading
+
+
+class TokenBucketLimiter:
+    """Thread-safe token buckets keyed by client, with hit counters"""
+
+    def __init__(self, rate, burst, max_keys=10000, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.clock = clock
+        self.buckets = {}  # key -> (tokens, last refill time)
+        self.next_prune = 0
+        self.allowed = 0
+        self.limited = 0
+        self.lock = threading.Lock()
+
+    def acquire(self, key):
+        """Take a token for key; return 0 if allowed, else seconds to wait"""
+        with self.lock:
+            now = self.clock()
+            tokens, last = self.buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+            if tokens >= 1:
+                self.buckets[key] = (tokens - 1, now)
+                self.allowed += 1
+                if len(self.buckets) > self.max_keys and now >= self.next_prune:
+                    self._prune(now)
+                return 0
+
+            self.buckets[key] = (tokens, now)
+            self.limited += 1
+            return (1 - tokens) / self.rate
+
+    def _prune(self, now):
+        """Forget buckets that have refilled completely.
+
+        Runs at most once per refill period, so a table full of active
+        clients is not rebuilt on every request.
+        """
+        full_after = self.burst / self.rate
+        self.buckets = {key: (tokens, last) for key, (tokens, last) in self.buckets.items()
+                        if now - last < full_after}
+        self.next_prune = now + full_after
+
+    def stats(self):
+        with self.lock:
+            return {
+                'allowed': self.allowed,
+                'limited': self.limited,
+                'clients': len(self.buckets),
+                'rate_per_second': self.rate,
+                'burst': self.burst
+            }
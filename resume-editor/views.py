@@ -0,0 +1,955 @@
+"""
+Resume Editor - Flask views and templates
+Imported by app.create_app(), so Flask and Jinja are only loaded when the
+web application is actually built.
+"""
+
+import os
+import json
+import math
+import hashlib
+from functools import wraps
+from datetime import datetime, timezone
+from flask import Blueprint, render_template, request, jsonify, Response, abort, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
+from converters import get_empty_resume, parse_document, render_document, get_format
+from rate_limit import TokenBucketLimiter
+from archive import list_backups
+from app import (
+    RESUME_FILE, ARCHIVE_DIR, HISTORY_DB, PUBLIC_MAX_AGE, PUBLIC_SHARED_MAX_AGE,
+    MAX_CONTENT_LENGTH, SAVE_RATE, SAVE_BURST, SAVE_LOCK, _public_cache,
+    load_resume, save_resume, merge_sections
+)
+
+bp = Blueprint('editor', __name__)
+
+save_limiter = TokenBucketLimiter(SAVE_RATE, SAVE_BURST)
+too_large_count = 0
+
+def write_limited(view):
+    """Reject oversized bodies (413) and throttle writes per client (429)"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        max_length = current_app.config.get('MAX_CONTENT_LENGTH')
+        if max_length and (request.content_length or 0) > max_length:
+            abort(413)
+
+        retry_after = save_limiter.acquire((request.remote_addr, RESUME_FILE))
+        if retry_after:
+            response = jsonify({'success': False, 'error': 'Too many saves, please slow down'})
+            response.status_code = 429
+            response.headers['Retry-After'] = str(math.ceil(retry_after))
+            return response
+        return view(*args, **kwargs)
+    return wrapper
+
+@bp.app_errorhandler(413)
+def request_too_large(e):
+    global too_large_count
+    too_large_count += 1
+    response = jsonify({'success': False, 'error': f'Request body exceeds {MAX_CONTENT_LENGTH} bytes'})
+    response.status_code = 413
+    return response
+
+# HTML Template
+HTML_TEMPLATE = '''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Resume Editor</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Arial, sans-serif; background: #f1f5f9; min-height: 100vh; }
+        
+        .header {
+            background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
+            color: white;
+            padding: 20px 40px;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            position: sticky;
+            top: 0;
+            z-index: 100;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        
+        .header h1 { font-size: 1.5em; font-weight: 600; }
+        .header-actions { display: flex; gap: 10px; }
+        
+        .btn {
+            padding: 10px 20px;
+            border: none;
+            border-radius: 6px;
+            cursor: pointer;
+            font-size: 14px;
+            font-weight: 600;
+            transition: all 0.2s;
+        }
+        
+        .btn-primary { background: #fff; color: #2563eb; }
+        .btn-primary:hover { background: #f0f9ff; }
+        .btn-success { background: #10b981; color: white; }
+        .btn-success:hover { background: #059669; }
+        .btn-danger { background: #ef4444; color: white; }
+        .btn-danger:hover { background: #dc2626; }
+        .btn-secondary { background: #64748b; color: white; }
+        .btn-secondary:hover { background: #475569; }
+        
+        .container { max-width: 900px; margin: 0 auto; padding: 30px 20px; }
+        
+        .card {
+            background: white;
+            border-radius: 12px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+            margin-bottom: 20px;
+            overflow: hidden;
+        }
+        
+        .card-header {
+            background: #f8fafc;
+            padding: 15px 20px;
+            border-bottom: 1px solid #e2e8f0;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }
+        
+        .card-header h2 {
+            font-size: 1.1em;
+            color: #1e293b;
+            display: flex;
+            align-items: center;
+            gap: 10px;
+        }
+        
+        .card-body { padding: 20px; }
+        
+        .form-group { margin-bottom: 15px; }
+        .form-group label {
+            display: block;
+            font-size: 0.85em;
+            font-weight: 600;
+            color: #475569;
+            margin-bottom: 5px;
+        }
+        
+        .form-control {
+            width: 100%;
+            padding: 10px 12px;
+            border: 1px solid #e2e8f0;
+            border-radius: 6px;
+            font-size: 14px;
+            transition: border-color 0.2s;
+        }
+        
+        .form-control:focus {
+            outline: none;
+            border-color: #2563eb;
+            box-shadow: 0 0 0 3px rgba(37, 99, 235, 0.1);
+        }
+        
+        textarea.form-control { min-height: 100px; resize: vertical; }
+        
+        .form-row {
+            display: grid;
+            grid-template-columns: repeat(2, 1fr);
+            gap: 15px;
+        }
+        
+        .item-card {
+            background: #f8fafc;
+            border: 1px solid #e2e8f0;
+            border-radius: 8px;
+            padding: 15px;
+            margin-bottom: 15px;
+            position: relative;
+        }
+        
+        .item-card:hover { border-color: #cbd5e1; }
+        
+        .item-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: flex-start;
+            margin-bottom: 10px;
+        }
+        
+        .item-number {
+            background: #2563eb;
+            color: white;
+            width: 24px;
+            height: 24px;
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 12px;
+            font-weight: 600;
+        }
+        
+        .delete-btn {
+            background: none;
+            border: none;
+            color: #ef4444;
+            cursor: pointer;
+            padding: 5px;
+            font-size: 18px;
+            opacity: 0.6;
+            transition: opacity 0.2s;
+        }
+        
+        .delete-btn:hover { opacity: 1; }
+        
+        .add-btn {
+            width: 100%;
+            padding: 12px;
+            border: 2px dashed #cbd5e1;
+            background: transparent;
+            color: #64748b;
+            border-radius: 8px;
+            cursor: pointer;
+            font-size: 14px;
+            transition: all 0.2s;
+        }
+        
+        .add-btn:hover {
+            border-color: #2563eb;
+            color: #2563eb;
+            background: #f0f9ff;
+        }
+        
+        .list-items { margin-top: 10px; }
+        
+        .list-item {
+            display: flex;
+            gap: 10px;
+            margin-bottom: 8px;
+        }
+        
+        .list-item input { flex: 1; }
+        
+        .list-item .delete-btn {
+            padding: 8px;
+            font-size: 16px;
+        }
+        
+        .toast {
+            position: fixed;
+            bottom: 20px;
+            right: 20px;
+            padding: 15px 25px;
+            border-radius: 8px;
+            color: white;
+            font-weight: 500;
+            opacity: 0;
+            transform: translateY(20px);
+            transition: all 0.3s;
+            z-index: 1000;
+        }
+        
+        .toast.show {
+            opacity: 1;
+            transform: translateY(0);
+        }
+        
+        .toast.success { background: #10b981; }
+        .toast.error { background: #ef4444; }
+        
+        .backup-info {
+            font-size: 0.8em;
+            color: #64748b;
+            margin-top: 5px;
+        }
+        
+        @media (max-width: 768px) {
+            .form-row { grid-template-columns: 1fr; }
+            .header { padding: 15px 20px; flex-direction: column; gap: 15px; }
+            .container { padding: 20px 15px; }
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>📝 Resume Editor</h1>
+        <div class="header-actions">
+            <button class="btn btn-primary" onclick="previewResume()">👁️ Preview</button>
+            <button class="btn btn-success" onclick="saveResume()" title="Save (Ctrl+S)">💾 Save</button>
+        </div>
+    </div>
+
+    <div class="container">
+        <!-- Profile Section -->
+        <div class="card">
+            <div class="card-header">
+                <h2>👤 Profile Information</h2>
+            </div>
+            <div class="card-body">
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Full Name</label>
+                        <input type="text" class="form-control" id="profile-name" placeholder="e.g., ABHINAV">
+                    </div>
+                    <div class="form-group">
+                        <label>Professional Title</label>
+                        <input type="text" class="form-control" id="profile-title" placeholder="e.g., Technical Lead | Solutions Architect">
+                    </div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Email</label>
+                        <input type="email" class="form-control" id="profile-email" placeholder="e.g., you@example.com">
+                    </div>
+                    <div class="form-group">
+                        <label>Phone</label>
+                        <input type="tel" class="form-control" id="profile-phone" placeholder="e.g., +91-XXXXX-XXXXX">
+                    </div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>LinkedIn (without https://)</label>
+                        <input type="text" class="form-control" id="profile-linkedin" placeholder="e.g., linkedin.com/in/yourprofile">
+                    </div>
+                    <div class="form-group">
+                        <label>Location</label>
+                        <input type="text" class="form-control" id="profile-location" placeholder="e.g., Nagpur, India">
+                    </div>
+                </div>
+                <div class="form-group">
+                    <label>Professional Summary</label>
+                    <textarea class="form-control" id="profile-summary" placeholder="Write a compelling summary of your professional background..."></textarea>
+                </div>
+            </div>
+        </div>
+
+        <!-- Skills Section -->
+        <div class="card">
+            <div class="card-header">
+                <h2>🛠️ Skills</h2>
+            </div>
+            <div class="card-body">
+                <div id="skills-container"></div>
+                <button class="add-btn" onclick="addSkill()">+ Add Skill Category</button>
+            </div>
+        </div>
+
+        <!-- Experience Section -->
+        <div class="card">
+            <div class="card-header">
+                <h2>💼 Experience</h2>
+            </div>
+            <div class="card-body">
+                <div id="experience-container"></div>
+                <button class="add-btn" onclick="addExperience()">+ Add Experience</button>
+            </div>
+        </div>
+
+        <!-- Achievements Section -->
+        <div class="card">
+            <div class="card-header">
+                <h2>🏆 Achievements</h2>
+            </div>
+            <div class="card-body">
+                <div id="achievements-container"></div>
+                <button class="add-btn" onclick="addAchievement()">+ Add Achievement</button>
+            </div>
+        </div>
+
+        <p class="backup-info">💡 Changes are autosaved; each save creates a backup in the <code>archive/</code> folder</p>
+    </div>
+
+    <div id="toast" class="toast"></div>
+
+    <script>
+        let resumeData = {{ resume_data | tojson }};
+
+        // Autosave: only sections that differ from the last save are sent
+        const SECTIONS = ['profile', 'skills', 'experience', 'achievements'];
+        const AUTOSAVE_DELAY = 1500;
+        let savedSnapshot = {};
+        let autosaveTimer = null;
+        let saveInFlight = false;
+
+        // Initialize on load
+        document.addEventListener('DOMContentLoaded', function() {
+            loadFormData();
+            savedSnapshot = snapshotSections(collectFormData());
+
+            const container = document.querySelector('.container');
+            container.addEventListener('input', scheduleAutosave);
+            container.addEventListener('click', function(e) {
+                if (e.target.closest('.add-btn, .delete-btn')) scheduleAutosave();
+            });
+
+            document.addEventListener('keydown', function(e) {
+                if ((e.ctrlKey || e.metaKey) && e.key.toLowerCase() === 's') {
+                    e.preventDefault();
+                    saveResume();
+                }
+            });
+        });
+
+        function loadFormData() {
+            // Profile
+            document.getElementById('profile-name').value = resumeData.profile.name || '';
+            document.getElementById('profile-title').value = resumeData.profile.title || '';
+            document.getElementById('profile-email').value = resumeData.profile.email || '';
+            document.getElementById('profile-phone').value = resumeData.profile.phone || '';
+            document.getElementById('profile-linkedin').value = resumeData.profile.linkedin || '';
+            document.getElementById('profile-location').value = resumeData.profile.location || '';
+            document.getElementById('profile-summary').value = resumeData.profile.summary || '';
+
+            // Skills
+            renderSkills();
+
+            // Experience
+            renderExperience();
+
+            // Achievements
+            renderAchievements();
+        }
+
+        // ===== SKILLS =====
+        function renderSkills() {
+            const container = document.getElementById('skills-container');
+            container.innerHTML = resumeData.skills.map((skill, idx) => `
+                <div class="item-card" data-idx="${idx}">
+                    <div class="item-header">
+                        <span class="item-number">${idx + 1}</span>
+                        <button class="delete-btn" onclick="deleteSkill(${idx})">🗑️</button>
+                    </div>
+                    <div class="form-row">
+                        <div class="form-group">
+                            <label>Category</label>
+                            <input type="text" class="form-control skill-category" value="${escapeHtml(skill.category)}" placeholder="e.g., Languages & Frameworks">
+                        </div>
+                        <div class="form-group">
+                            <label>Skills (comma-separated)</label>
+                            <input type="text" class="form-control skill-items" value="${escapeHtml(skill.items)}" placeholder="e.g., Java, Spring Boot, Microservices">
+                        </div>
+                    </div>
+                </div>
+            `).join('');
+        }
+
+        function addSkill() {
+            collectSkillsData(); // Collect current form data first
+            resumeData.skills.push({ category: '', items: '' });
+            renderSkills();
+        }
+
+        function deleteSkill(idx) {
+            collectSkillsData(); // Collect current form data first
+            resumeData.skills.splice(idx, 1);
+            renderSkills();
+        }
+
+        function collectSkillsData() {
+            const skillCards = document.querySelectorAll('#skills-container .item-card');
+            resumeData.skills = Array.from(skillCards).map(card => ({
+                category: card.querySelector('.skill-category')?.value || '',
+                items: card.querySelector('.skill-items')?.value || ''
+            }));
+        }
+
+        // ===== EXPERIENCE =====
+        function renderExperience() {
+            const container = document.getElementById('experience-container');
+            container.innerHTML = resumeData.experience.map((exp, idx) => `
+                <div class="item-card" data-idx="${idx}">
+                    <div class="item-header">
+                        <span class="item-number">${idx + 1}</span>
+                        <button class="delete-btn" onclick="deleteExperience(${idx})">🗑️</button>
+                    </div>
+                    <div class="form-row">
+                        <div class="form-group">
+                            <label>Job Title</label>
+                            <input type="text" class="form-control exp-title" value="${escapeHtml(exp.title)}" placeholder="e.g., Technical Lead">
+                        </div>
+                        <div class="form-group">
+                            <label>Company</label>
+                            <input type="text" class="form-control exp-company" value="${escapeHtml(exp.company)}" placeholder="e.g., Tech Corp">
+                        </div>
+                    </div>
+                    <div class="form-group">
+                        <label>Period</label>
+                        <input type="text" class="form-control exp-period" value="${escapeHtml(exp.period)}" placeholder="e.g., 2020 - Present">
+                    </div>
+                    <div class="form-group">
+                        <label>Responsibilities</label>
+                        <div class="list-items" id="exp-resp-${idx}">
+                            ${(exp.responsibilities || []).map((resp, rIdx) => `
+                                <div class="list-item">
+                                    <input type="text" class="form-control exp-resp-item" value="${escapeHtml(resp)}" placeholder="Describe a responsibility...">
+                                    <button class="delete-btn" onclick="deleteResponsibility(${idx}, ${rIdx})">×</button>
+                                </div>
+                            `).join('')}
+                        </div>
+                        <button class="add-btn" style="margin-top:10px" onclick="addResponsibility(${idx})">+ Add Responsibility</button>
+                    </div>
+                </div>
+            `).join('');
+        }
+
+        function addExperience() {
+            collectExperienceData(); // Collect current form data first
+            resumeData.experience.push({ title: '', company: '', period: '', responsibilities: [''] });
+            renderExperience();
+        }
+
+        function deleteExperience(idx) {
+            collectExperienceData(); // Collect current form data first
+            resumeData.experience.splice(idx, 1);
+            renderExperience();
+        }
+
+        function addResponsibility(expIdx) {
+            collectExperienceData(); // Collect current form data first
+            resumeData.experience[expIdx].responsibilities.push('');
+            renderExperience();
+        }
+
+        function deleteResponsibility(expIdx, respIdx) {
+            collectExperienceData(); // Collect current form data first
+            resumeData.experience[expIdx].responsibilities.splice(respIdx, 1);
+            renderExperience();
+        }
+
+        function collectExperienceData() {
+            const expCards = document.querySelectorAll('#experience-container .item-card');
+            resumeData.experience = Array.from(expCards).map(card => ({
+                title: card.querySelector('.exp-title')?.value || '',
+                company: card.querySelector('.exp-company')?.value || '',
+                period: card.querySelector('.exp-period')?.value || '',
+                responsibilities: Array.from(card.querySelectorAll('.exp-resp-item')).map(input => input.value)
+            }));
+        }
+
+        // ===== ACHIEVEMENTS =====
+        function renderAchievements() {
+            const container = document.getElementById('achievements-container');
+            container.innerHTML = resumeData.achievements.map((ach, idx) => `
+                <div class="item-card" data-idx="${idx}">
+                    <div class="item-header">
+                        <span class="item-number">${idx + 1}</span>
+                        <button class="delete-btn" onclick="deleteAchievement(${idx})">🗑️</button>
+                    </div>
+                    <div class="form-group">
+                        <label>Achievement Title</label>
+                        <input type="text" class="form-control ach-title" value="${escapeHtml(ach.title)}" placeholder="e.g., Database Migration Leadership">
+                    </div>
+                    <div class="form-group">
+                        <label>Points</label>
+                        <div class="list-items" id="ach-points-${idx}">
+                            ${(ach.points || []).map((point, pIdx) => `
+                                <div class="list-item">
+                                    <input type="text" class="form-control ach-point-item" value="${escapeHtml(point)}" placeholder="Describe an achievement point...">
+                                    <button class="delete-btn" onclick="deleteAchievementPoint(${idx}, ${pIdx})">×</button>
+                                </div>
+                            `).join('')}
+                        </div>
+                        <button class="add-btn" style="margin-top:10px" onclick="addAchievementPoint(${idx})">+ Add Point</button>
+                    </div>
+                </div>
+            `).join('');
+        }
+
+        function addAchievement() {
+            collectAchievementsData(); // Collect current form data first
+            resumeData.achievements.push({ title: '', points: [''] });
+            renderAchievements();
+        }
+
+        function deleteAchievement(idx) {
+            collectAchievementsData(); // Collect current form data first
+            resumeData.achievements.splice(idx, 1);
+            renderAchievements();
+        }
+
+        function addAchievementPoint(achIdx) {
+            collectAchievementsData(); // Collect current form data first
+            resumeData.achievements[achIdx].points.push('');
+            renderAchievements();
+        }
+
+        function deleteAchievementPoint(achIdx, pointIdx) {
+            collectAchievementsData(); // Collect current form data first
+            resumeData.achievements[achIdx].points.splice(pointIdx, 1);
+            renderAchievements();
+        }
+
+        function collectAchievementsData() {
+            const achCards = document.querySelectorAll('#achievements-container .item-card');
+            resumeData.achievements = Array.from(achCards).map(card => ({
+                title: card.querySelector('.ach-title')?.value || '',
+                points: Array.from(card.querySelectorAll('.ach-point-item')).map(input => input.value)
+            }));
+        }
+
+        // ===== COLLECT & SAVE =====
+        function collectFormData() {
+            // Profile
+            resumeData.profile = {
+                name: document.getElementById('profile-name').value,
+                title: document.getElementById('profile-title').value,
+                email: document.getElementById('profile-email').value,
+                phone: document.getElementById('profile-phone').value,
+                linkedin: document.getElementById('profile-linkedin').value,
+                location: document.getElementById('profile-location').value,
+                summary: document.getElementById('profile-summary').value
+            };
+
+            // Skills
+            const skillCards = document.querySelectorAll('#skills-container .item-card');
+            resumeData.skills = Array.from(skillCards).map(card => ({
+                category: card.querySelector('.skill-category').value,
+                items: card.querySelector('.skill-items').value
+            }));
+
+            // Experience
+            const expCards = document.querySelectorAll('#experience-container .item-card');
+            resumeData.experience = Array.from(expCards).map(card => ({
+                title: card.querySelector('.exp-title').value,
+                company: card.querySelector('.exp-company').value,
+                period: card.querySelector('.exp-period').value,
+                responsibilities: Array.from(card.querySelectorAll('.exp-resp-item')).map(input => input.value).filter(v => v.trim())
+            }));
+
+            // Achievements
+            const achCards = document.querySelectorAll('#achievements-container .item-card');
+            resumeData.achievements = Array.from(achCards).map(card => ({
+                title: card.querySelector('.ach-title').value,
+                points: Array.from(card.querySelectorAll('.ach-point-item')).map(input => input.value).filter(v => v.trim())
+            }));
+
+            return resumeData;
+        }
+
+        function snapshotSections(data) {
+            const snapshot = {};
+            SECTIONS.forEach(key => { snapshot[key] = JSON.stringify(data[key]); });
+            return snapshot;
+        }
+
+        function getDirtySections(snapshot) {
+            return SECTIONS.filter(key => snapshot[key] !== savedSnapshot[key]);
+        }
+
+        function scheduleAutosave() {
+            clearTimeout(autosaveTimer);
+            autosaveTimer = setTimeout(() => saveResume(true), AUTOSAVE_DELAY);
+        }
+
+        async function saveResume(isAutosave = false) {
+            clearTimeout(autosaveTimer);
+            if (saveInFlight) {
+                scheduleAutosave();
+                return;
+            }
+
+            const data = collectFormData();
+            const snapshot = snapshotSections(data);
+            const dirty = getDirtySections(snapshot);
+
+            if (dirty.length === 0) {
+                if (!isAutosave) showToast('✅ No changes to save', 'success');
+                return;
+            }
+
+            const payload = {};
+            dirty.forEach(key => { payload[key] = data[key]; });
+
+            saveInFlight = true;
+            try {
+                const response = await fetch('/save', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify(payload)
+                });
+                
+                const result = await response.json();
+
+                if (response.status === 429) {
+                    const retryAfter = parseInt(response.headers.get('Retry-After') || '2', 10);
+                    clearTimeout(autosaveTimer);
+                    autosaveTimer = setTimeout(() => saveResume(true), retryAfter * 1000);
+                    if (!isAutosave) showToast('⏳ Saving too often, retrying in ' + retryAfter + 's', 'error');
+                } else if (result.success) {
+                    dirty.forEach(key => { savedSnapshot[key] = snapshot[key]; });
+                    showToast(isAutosave ? '✅ Autosaved' : '✅ Resume saved successfully!', 'success');
+                } else {
+                    showToast('❌ Error: ' + result.error, 'error');
+                }
+            } catch (err) {
+                showToast('❌ Error saving resume', 'error');
+            } finally {
+                saveInFlight = false;
+            }
+        }
+
+        function previewResume() {
+            window.open('/preview', '_blank');
+        }
+
+        function showToast(message, type) {
+            const toast = document.getElementById('toast');
+            toast.textContent = message;
+            toast.className = 'toast ' + type + ' show';
+            setTimeout(() => {
+                toast.className = 'toast';
+            }, 3000);
+        }
+
+        function escapeHtml(str) {
+            if (!str) return '';
+            return str.replace(/&/g, '&amp;')
+                      .replace(/</g, '&lt;')
+                      .replace(/>/g, '&gt;')
+                      .replace(/"/g, '&quot;');
+        }
+    </script>
+</body>
+</html>
+'''
+
+# Preview Template (same as resume.html but embedded)
+PREVIEW_TEMPLATE = '''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Resume Preview</title>
+    <style>
+        *{margin:0;padding:0;box-sizing:border-box}
+        body{font-family:'Segoe UI',Arial,sans-serif;line-height:1.6;color:#333;background:#f5f5f5;padding:20px}
+        .controls{max-width:850px;margin:0 auto 20px;display:flex;gap:10px;justify-content:flex-end}
+        .btn{background:#2563eb;color:#fff;border:none;padding:12px 24px;font-size:14px;border-radius:6px;cursor:pointer;font-weight:600}
+        .btn:hover{background:#1d4ed8}
+        .btn-secondary{background:#64748b}
+        .btn-secondary:hover{background:#475569}
+        .container{max-width:850px;margin:0 auto;background:#fff;padding:50px 60px;box-shadow:0 2px 10px rgba(0,0,0,.1)}
+        .header{border-bottom:3px solid #2563eb;padding-bottom:20px;margin-bottom:30px}
+        .header h1{font-size:2.4em;color:#1e293b;margin-bottom:8px;letter-spacing:-0.5px}
+        .header .title{font-size:1.25em;color:#2563eb;margin-bottom:15px;font-weight:600}
+        .contact-info{display:flex;flex-wrap:wrap;gap:8px 20px;font-size:.9em;color:#64748b}
+        .contact-info a{color:#2563eb;text-decoration:none}
+        .section{margin-bottom:28px}
+        .section h2{font-size:1.2em;color:#1e293b;margin-bottom:12px;text-transform:uppercase;letter-spacing:1px;border-bottom:2px solid #e2e8f0;padding-bottom:6px}
+        .summary{font-size:.95em;line-height:1.7;color:#475569;text-align:justify}
+        .skills-grid{display:grid;grid-template-columns:repeat(2,1fr);gap:10px}
+        .skill-item{display:flex;font-size:.9em;line-height:1.5}
+        .skill-item strong{min-width:160px;color:#1e293b;flex-shrink:0}
+        .skill-item span{color:#475569}
+        .experience-item,.achievement-item{margin-bottom:20px}
+        .experience-item h3,.achievement-item h3{font-size:1.05em;color:#1e293b;margin-bottom:4px}
+        .experience-item .meta{color:#64748b;font-size:.85em;margin-bottom:8px;font-style:italic}
+        .experience-item ul,.achievement-item ul{margin-left:18px;margin-top:6px}
+        .experience-item li,.achievement-item li{margin-bottom:5px;color:#475569;font-size:.9em;line-height:1.55}
+        @media print{
+            @page{size:A4;margin:15mm}
+            body{background:#fff;padding:0;font-size:11pt}
+            .controls{display:none!important}
+            .container{box-shadow:none;padding:0;max-width:100%;margin:0}
+        }
+    </style>
+</head>
+<body>
+    {% if not public %}
+    <div class="controls">
+        <button class="btn" onclick="window.print()">📥 Download PDF</button>
+        <button class="btn btn-secondary" onclick="window.close()">✕ Close</button>
+    </div>
+    {% endif %}
+    <div class="container">
+        <div class="header">
+            <h1>{{ d.profile.name }}</h1>
+            <div class="title">{{ d.profile.title }}</div>
+            <div class="contact-info">
+                <span>📧 <a href="mailto:{{ d.profile.email }}">{{ d.profile.email }}</a></span>
+                <span>📱 {{ d.profile.phone }}</span>
+                <span>💼 <a href="https://{{ d.profile.linkedin }}" target="_blank">LinkedIn</a></span>
+                <span>📍 {{ d.profile.location }}</span>
+            </div>
+        </div>
+        <div class="section">
+            <h2>Professional Summary</h2>
+            <p class="summary">{{ d.profile.summary }}</p>
+        </div>
+        <div class="section">
+            <h2>Core Competencies</h2>
+            <div class="skills-grid">
+                {% for skill in d.skills %}
+                <div class="skill-item"><strong>{{ skill['category'] }}:</strong><span>{{ skill['items'] }}</span></div>
+                {% endfor %}
+            </div>
+        </div>
+        <div class="section">
+            <h2>Professional Experience</h2>
+            {% for exp in d.experience %}
+            <div class="experience-item">
+                <h3>{{ exp['title'] }}</h3>
+                <div class="meta">{{ exp['company'] }} | {{ exp['period'] }}</div>
+                <ul>
+                    {% for resp in exp['responsibilities'] %}
+                    <li>{{ resp }}</li>
+                    {% endfor %}
+                </ul>
+            </div>
+            {% endfor %}
+        </div>
+        <div class="section">
+            <h2>Key Achievements</h2>
+            {% for ach in d.achievements %}
+            <div class="achievement-item">
+                <h3>{{ ach['title'] }}</h3>
+                <ul>
+                    {% for point in ach['points'] %}
+                    <li>{{ point }}</li>
+                    {% endfor %}
+                </ul>
+            </div>
+            {% endfor %}
+        </div>
+    </div>
+</body>
+</html>
+'''
+
+@bp.route('/')
+def index():
+    """Main editor page"""
+    resume_data = load_resume()
+    return render_template('editor.html', resume_data=resume_data)
+
+@bp.route('/save', methods=['POST'])
+@write_limited
+def save():
+    """Save resume data.
+
+    Accepts either the full document or only the sections that changed;
+    missing sections are kept from the file on disk.
+    """
+    try:
+        sections = request.get_json()
+        if not isinstance(sections, dict):
+            raise ValueError('Expected a JSON object')
+        # Hold the lock across read-merge-write so concurrent partial saves
+        # (two tabs, autosave racing Ctrl+S) cannot drop each other's sections
+        with SAVE_LOCK:
+            data = merge_sections(load_resume(), sections)
+            saved = save_resume(data)
+        return jsonify({'success': True, 'saved': saved})
+    except RequestEntityTooLarge:
+        raise
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)})
+
+@bp.route('/preview')
+def preview():
+    """Preview resume"""
+    resume_data = load_resume()
+    return render_template('preview.html', d=resume_data)
+
+def load_public():
+    """Return (raw bytes, etag, last modified) of the resume file"""
+    if not os.path.exists(RESUME_FILE):
+        raw = json.dumps(get_empty_resume()).encode('utf-8')
+        return raw, hashlib.sha256(raw).hexdigest()[:32], None
+    with open(RESUME_FILE, 'rb') as f:
+        raw = f.read()
+    mtime = datetime.fromtimestamp(os.path.getmtime(RESUME_FILE), timezone.utc)
+    return raw, hashlib.sha256(raw).hexdigest()[:32], mtime
+
+def public_response(build, mimetype):
+    """Serve build(raw) with caching headers, answering 304 when unchanged"""
+    raw, digest, mtime = load_public()
+    etag = f'{digest}-{mimetype.split("/")[1]}'
+    cached = _public_cache.get(request.path)
+    if cached is None or cached[0] != etag:
+        cached = _public_cache[request.path] = (etag, build(raw))
+
+    response = Response(cached[1], mimetype=mimetype)
+    response.set_etag(etag)
+    response.last_modified = mtime
+    response.cache_control.public = True
+    response.cache_control.max_age = PUBLIC_MAX_AGE
+    response.cache_control.s_maxage = PUBLIC_SHARED_MAX_AGE
+    return response.make_conditional(request)
+
+@bp.route('/public')
+def public_resume():
+    """Read-only rendered resume, safe to cache"""
+    return public_response(
+        lambda raw: render_template('preview.html', d=json.loads(raw), public=True),
+        'text/html'
+    )
+
+@bp.route('/public/resume-data.json')
+def public_resume_data():
+    """Read-only resume data, safe to cache"""
+    return public_response(lambda raw: raw, 'application/json')
+
+@bp.route('/import', methods=['POST'])
+@write_limited
+def import_resume():
+    """Import a resume document (?format=native|jsonresume|yaml|markdown)"""
+    try:
+        data = parse_document(request.args.get('format', 'native'), request.get_data(as_text=True))
+        saved = save_resume(data)
+        return jsonify({'success': True, 'saved': saved})
+    except RequestEntityTooLarge:
+        raise
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)})
+
+@bp.route('/export/<fmt>')
+def export_resume(fmt):
+    """Download the resume in another format"""
+    try:
+        mimetype, ext = get_format(fmt)[2:]
+        body = render_document(fmt, load_resume())
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    return Response(body, mimetype=mimetype, headers={
+        'Content-Disposition': f'attachment; filename=resume-{fmt}.{ext}'
+    })
+
+@bp.route('/backups')
+def backups():
+    """List backup files, or query the history database.
+
+    ?since=&until= (ISO dates) lists saved versions in that range,
+    ?section=profile.title lists versions where that section changed,
+    adding &hash= lists versions whose section had exactly that content.
+    Other query arguments (e.g. cache busters) are ignored.
+    """
+    args = request.args
+    if 'hash' in args and 'section' not in args:
+        return jsonify({'success': False, 'error': 'hash requires section'}), 400
+    if not any(key in args for key in ('since', 'until', 'section')):
+        return jsonify(list_backups(ARCHIVE_DIR))
+    if not HISTORY_DB:
+        return jsonify({'success': False, 'error': 'History queries need RESUME_HISTORY_DB'}), 400
+
+    import history
+    if 'section' in args and 'hash' in args:
+        return jsonify(history.find_section(HISTORY_DB, args['section'], args['hash']))
+    if 'section' in args:
+        return jsonify(history.section_changes(HISTORY_DB, args['section']))
+    try:
+        versions = history.list_versions(HISTORY_DB, args.get('since'), args.get('until'))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'since and until must be ISO dates, e.g. 2025-10-01'}), 400
+    return jsonify(versions)
+
+@bp.route('/stats')
+def stats():
+    """Write throttling counters"""
+    return jsonify({
+        'save': save_limiter.stats(),
+        'too_large': too_large_count,
+        'max_content_length': MAX_CONTENT_LENGTH
+    })